@@ -4,17 +4,27 @@ Financial Dashboard - Multi-asset Comparison
 Enhanced version with metrics, drawdowns, news, multilingual support, and Credit Risk Analysis
 """
 
+import io
+import json
+import os
+import tempfile
+import bisect
+import re
+import time
+from pathlib import Path
+from types import MappingProxyType
 import streamlit as st
 import pandas as pd
 import numpy as np
 import yfinance as yf
-from datetime import datetime, timedelta
-import plotly.express as px
+from datetime import date, datetime, timedelta
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import feedparser
 import requests
 from scipy.stats import norm
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # =============================================================================
 # TRANSLATIONS
@@ -23,15 +33,15 @@ TRANSLATIONS = {
     "English": {
         # General
         "page_title": "Financial Dashboard",
-        "main_title": "📈 Financial Dashboard",
+        "main_title": "Financial Dashboard",
         "comparison": "Comparison",
         "vs": "vs",
         "years": "years",
         "over": "over",
         
         # Sidebar
-        "settings": "⚙️ Settings",
-        "language": "🌐 Language",
+        "settings": "Settings",
+        "language": "Language",
         "asset_selection": "Asset Selection",
         "first_asset": "First asset",
         "second_asset": "Second asset",
@@ -41,7 +51,11 @@ TRANSLATIONS = {
         "show_normalized": "Show normalized prices",
         "show_drawdown": "Show drawdowns",
         "show_volume": "Show volumes",
-        "refresh_data": "🔄 Refresh data",
+        "show_correlation": "Show correlation",
+        "show_news": "Show news",
+        "show_raw_data": "Show raw data",
+        "show_all_raw_data": "Show all columns and rows",
+        "refresh_data": "Refresh data",
         "last_update": "Last update",
         "created_with": "Dashboard created with Streamlit",
         
@@ -52,14 +66,14 @@ TRANSLATIONS = {
         "commodities": "Commodities",
         
         # Metrics
-        "key_metrics": "📊 Key Metrics",
+        "key_metrics": "Key Metrics",
         "return": "Return",
         "volatility": "Volatility",
         "current_price": "Current Price",
         "sharpe": "Sharpe",
         
         # Charts
-        "performance_comparison": "📈 Performance Comparison",
+        "performance_comparison": "Performance Comparison",
         "normalized_prices": "Normalized prices",
         "prices": "Prices",
         "normalized_price_zscore": "Normalized Price (z-score)",
@@ -68,16 +82,17 @@ TRANSLATIONS = {
         "asset": "Asset",
         
         # Drawdowns
-        "drawdowns_title": "📉 Drawdowns (losses from peak)",
+        "drawdowns_title": "Drawdowns (losses from peak)",
         "drawdowns_from_ath": "Drawdowns from all-time highs",
         "max_drawdown": "Max Drawdown",
         
         # Volume
-        "trading_volumes": "📊 Trading Volumes",
+        "trading_volumes": "Trading Volumes",
         "volume": "Volume",
+        "volume_periods": {"D": "daily", "W": "weekly", "MS": "monthly", "QS": "quarterly"},
         
         # Correlation
-        "correlation_analysis": "🔗 Correlation Analysis",
+        "correlation_analysis": "Correlation Analysis",
         "overall_correlation": "Overall Correlation",
         "rolling_correlation": "Rolling Correlation",
         "days": "days",
@@ -88,17 +103,17 @@ TRANSLATIONS = {
         "negative": "Negative correlation",
         
         # News
-        "recent_news": "📰 Recent News",
+        "recent_news": "Recent News",
         "no_news": "No news available",
         
         # Data
-        "raw_data": "📋 Raw Data",
+        "raw_data": "Raw Data",
         "view_data": "View data",
         "merged_data": "View merged data",
         
         # Export
-        "export_data": "💾 Export Data",
-        "download": "📥 Download",
+        "export_data": "Export Data",
+        "download": "Download",
         
         # Errors
         "loading_data": "Loading data...",
@@ -106,7 +121,7 @@ TRANSLATIONS = {
         "error_fetching": "Error fetching",
         
         # Economic Analysis
-        "economic_analysis": "🌍 Economic Analysis by Continent",
+        "economic_analysis": "Economic Analysis by Continent",
         "select_continent": "Select a continent",
         "generate_analysis": "Generate Analysis",
         "analysis_disclaimer": "This analysis is generated by AI and should not be considered as financial advice.",
@@ -128,7 +143,7 @@ TRANSLATIONS = {
         "last_analysis": "Analysis generated on",
         
         # Credit Risk Analysis
-        "credit_risk": "🏦 Credit Risk Analysis",
+        "credit_risk": "Credit Risk Analysis",
         "credit_risk_title": "Credit Risk Analysis",
         "enter_ticker": "Enter ticker symbol",
         "analyze_button": "Analyze Credit Risk",
@@ -160,15 +175,15 @@ TRANSLATIONS = {
     "Français": {
         # General
         "page_title": "Dashboard Financier",
-        "main_title": "📈 Dashboard Financier",
+        "main_title": "Dashboard Financier",
         "comparison": "Comparaison",
         "vs": "vs",
         "years": "ans",
         "over": "sur",
         
         # Sidebar
-        "settings": "⚙️ Paramètres",
-        "language": "🌐 Langue",
+        "settings": "Paramètres",
+        "language": "Langue",
         "asset_selection": "Sélection des actifs",
         "first_asset": "Premier actif",
         "second_asset": "Deuxième actif",
@@ -178,7 +193,11 @@ TRANSLATIONS = {
         "show_normalized": "Afficher les prix normalisés",
         "show_drawdown": "Afficher les drawdowns",
         "show_volume": "Afficher les volumes",
-        "refresh_data": "🔄 Rafraîchir les données",
+        "show_correlation": "Afficher la corrélation",
+        "show_news": "Afficher les actualités",
+        "show_raw_data": "Afficher les données brutes",
+        "show_all_raw_data": "Afficher toutes les colonnes et lignes",
+        "refresh_data": "Rafraîchir les données",
         "last_update": "Dernière mise à jour",
         "created_with": "Dashboard créé avec Streamlit",
         
@@ -189,14 +208,14 @@ TRANSLATIONS = {
         "commodities": "Matières premières",
         
         # Metrics
-        "key_metrics": "📊 Métriques clés",
+        "key_metrics": "Métriques clés",
         "return": "Rendement",
         "volatility": "Volatilité",
         "current_price": "Prix actuel",
         "sharpe": "Sharpe",
         
         # Charts
-        "performance_comparison": "📈 Comparaison des performances",
+        "performance_comparison": "Comparaison des performances",
         "normalized_prices": "Prix normalisés",
         "prices": "Prix",
         "normalized_price_zscore": "Prix normalisé (z-score)",
@@ -205,16 +224,17 @@ TRANSLATIONS = {
         "asset": "Actif",
         
         # Drawdowns
-        "drawdowns_title": "📉 Drawdowns (pertes depuis le plus haut)",
+        "drawdowns_title": "Drawdowns (pertes depuis le plus haut)",
         "drawdowns_from_ath": "Drawdowns depuis les plus hauts historiques",
         "max_drawdown": "Drawdown max",
         
         # Volume
-        "trading_volumes": "📊 Volumes d'échange",
+        "trading_volumes": "Volumes d'échange",
         "volume": "Volume",
+        "volume_periods": {"D": "quotidien", "W": "hebdomadaire", "MS": "mensuel", "QS": "trimestriel"},
         
         # Correlation
-        "correlation_analysis": "🔗 Analyse de corrélation",
+        "correlation_analysis": "Analyse de corrélation",
         "overall_correlation": "Corrélation globale",
         "rolling_correlation": "Corrélation glissante",
         "days": "jours",
@@ -225,17 +245,17 @@ TRANSLATIONS = {
         "negative": "Corrélation négative",
         
         # News
-        "recent_news": "📰 Actualités récentes",
+        "recent_news": "Actualités récentes",
         "no_news": "Aucune actualité disponible",
         
         # Data
-        "raw_data": "📋 Données brutes",
+        "raw_data": "Données brutes",
         "view_data": "Voir les données",
         "merged_data": "Voir les données fusionnées",
         
         # Export
-        "export_data": "💾 Exporter les données",
-        "download": "📥 Télécharger",
+        "export_data": "Exporter les données",
+        "download": "Télécharger",
         
         # Errors
         "loading_data": "Chargement des données...",
@@ -243,7 +263,7 @@ TRANSLATIONS = {
         "error_fetching": "Erreur lors du chargement de",
         
         # Economic Analysis
-        "economic_analysis": "🌍 Analyse Économique par Continent",
+        "economic_analysis": "Analyse Économique par Continent",
         "select_continent": "Sélectionner un continent",
         "generate_analysis": "Générer l'analyse",
         "analysis_disclaimer": "Cette analyse est générée par IA et ne constitue pas un conseil financier.",
@@ -265,7 +285,7 @@ TRANSLATIONS = {
         "last_analysis": "Analyse générée le",
         
         # Credit Risk Analysis
-        "credit_risk": "🏦 Analyse du Risque de Crédit",
+        "credit_risk": "Analyse du Risque de Crédit",
         "credit_risk_title": "Analyse du Risque de Crédit",
         "enter_ticker": "Entrez le symbole boursier",
         "analyze_button": "Analyser le Risque de Crédit",
@@ -296,13 +316,13 @@ TRANSLATIONS = {
     
     "Español": {
         "page_title": "Panel Financiero",
-        "main_title": "📈 Panel Financiero",
+        "main_title": "Panel Financiero",
         "comparison": "Comparación",
         "vs": "vs",
         "years": "años",
         "over": "durante",
-        "settings": "⚙️ Configuración",
-        "language": "🌐 Idioma",
+        "settings": "Configuración",
+        "language": "Idioma",
         "asset_selection": "Selección de activos",
         "first_asset": "Primer activo",
         "second_asset": "Segundo activo",
@@ -312,31 +332,36 @@ TRANSLATIONS = {
         "show_normalized": "Mostrar precios normalizados",
         "show_drawdown": "Mostrar drawdowns",
         "show_volume": "Mostrar volúmenes",
-        "refresh_data": "🔄 Actualizar datos",
+        "show_correlation": "Mostrar correlación",
+        "show_news": "Mostrar noticias",
+        "show_raw_data": "Mostrar datos brutos",
+        "show_all_raw_data": "Mostrar todas las columnas y filas",
+        "refresh_data": "Actualizar datos",
         "last_update": "Última actualización",
         "created_with": "Panel creado con Streamlit",
         "cryptocurrencies": "Criptomonedas",
         "indices": "Índices",
         "tech_stocks": "Acciones tecnológicas",
         "commodities": "Materias primas",
-        "key_metrics": "📊 Métricas clave",
+        "key_metrics": "Métricas clave",
         "return": "Rendimiento",
         "volatility": "Volatilidad",
         "current_price": "Precio actual",
         "sharpe": "Sharpe",
-        "performance_comparison": "📈 Comparación de rendimiento",
+        "performance_comparison": "Comparación de rendimiento",
         "normalized_prices": "Precios normalizados",
         "prices": "Precios",
         "normalized_price_zscore": "Precio normalizado (z-score)",
         "price_usd": "Precio ($)",
         "date": "Fecha",
         "asset": "Activo",
-        "drawdowns_title": "📉 Drawdowns (pérdidas desde máximos)",
+        "drawdowns_title": "Drawdowns (pérdidas desde máximos)",
         "drawdowns_from_ath": "Drawdowns desde máximos históricos",
         "max_drawdown": "Drawdown máximo",
-        "trading_volumes": "📊 Volúmenes de negociación",
+        "trading_volumes": "Volúmenes de negociación",
         "volume": "Volumen",
-        "correlation_analysis": "🔗 Análisis de correlación",
+        "volume_periods": {"D": "diario", "W": "semanal", "MS": "mensual", "QS": "trimestral"},
+        "correlation_analysis": "Análisis de correlación",
         "overall_correlation": "Correlación global",
         "rolling_correlation": "Correlación móvil",
         "days": "días",
@@ -345,17 +370,17 @@ TRANSLATIONS = {
         "moderate": "Correlación moderada",
         "weak": "Correlación débil",
         "negative": "Correlación negativa",
-        "recent_news": "📰 Noticias recientes",
+        "recent_news": "Noticias recientes",
         "no_news": "No hay noticias disponibles",
-        "raw_data": "📋 Datos brutos",
+        "raw_data": "Datos brutos",
         "view_data": "Ver datos",
         "merged_data": "Ver datos combinados",
-        "export_data": "💾 Exportar datos",
-        "download": "📥 Descargar",
+        "export_data": "Exportar datos",
+        "download": "Descargar",
         "loading_data": "Cargando datos...",
         "error_loading": "No se pueden cargar los datos. Inténtelo de nuevo más tarde.",
         "error_fetching": "Error al cargar",
-        "economic_analysis": "🌍 Análisis Económico por Continente",
+        "economic_analysis": "Análisis Económico por Continente",
         "select_continent": "Seleccionar un continente",
         "generate_analysis": "Generar Análisis",
         "analysis_disclaimer": "Este análisis es generado por IA y no debe considerarse como consejo financiero.",
@@ -375,7 +400,7 @@ TRANSLATIONS = {
         "economic_indicators": "Indicadores Económicos Clave",
         "ai_analysis": "Análisis Económico IA",
         "last_analysis": "Análisis generado el",
-        "credit_risk": "🏦 Análisis de Riesgo de Crédito",
+        "credit_risk": "Análisis de Riesgo de Crédito",
         "credit_risk_title": "Análisis de Riesgo de Crédito",
         "enter_ticker": "Ingrese el símbolo bursátil",
         "analyze_button": "Analizar Riesgo de Crédito",
@@ -406,13 +431,13 @@ TRANSLATIONS = {
     
     "中文": {
         "page_title": "金融仪表板",
-        "main_title": "📈 金融仪表板",
+        "main_title": "金融仪表板",
         "comparison": "比较",
         "vs": "与",
         "years": "年",
         "over": "期间",
-        "settings": "⚙️ 设置",
-        "language": "🌐 语言",
+        "settings": "设置",
+        "language": "语言",
         "asset_selection": "资产选择",
         "first_asset": "第一资产",
         "second_asset": "第二资产",
@@ -422,31 +447,36 @@ TRANSLATIONS = {
         "show_normalized": "显示标准化价格",
         "show_drawdown": "显示回撤",
         "show_volume": "显示成交量",
-        "refresh_data": "🔄 刷新数据",
+        "show_correlation": "显示相关性",
+        "show_news": "显示新闻",
+        "show_raw_data": "显示原始数据",
+        "show_all_raw_data": "显示所有列和行",
+        "refresh_data": "刷新数据",
         "last_update": "最后更新",
         "created_with": "使用Streamlit创建的仪表板",
         "cryptocurrencies": "加密货币",
         "indices": "指数",
         "tech_stocks": "科技股",
         "commodities": "大宗商品",
-        "key_metrics": "📊 关键指标",
+        "key_metrics": "关键指标",
         "return": "回报率",
         "volatility": "波动率",
         "current_price": "当前价格",
         "sharpe": "夏普比率",
-        "performance_comparison": "📈 绩效比较",
+        "performance_comparison": "绩效比较",
         "normalized_prices": "标准化价格",
         "prices": "价格",
         "normalized_price_zscore": "标准化价格 (z-score)",
         "price_usd": "价格 ($)",
         "date": "日期",
         "asset": "资产",
-        "drawdowns_title": "📉 回撤（从峰值的损失）",
+        "drawdowns_title": "回撤（从峰值的损失）",
         "drawdowns_from_ath": "从历史高点的回撤",
         "max_drawdown": "最大回撤",
-        "trading_volumes": "📊 交易量",
+        "trading_volumes": "交易量",
         "volume": "成交量",
-        "correlation_analysis": "🔗 相关性分析",
+        "volume_periods": {"D": "日", "W": "周", "MS": "月", "QS": "季度"},
+        "correlation_analysis": "相关性分析",
         "overall_correlation": "总体相关性",
         "rolling_correlation": "滚动相关性",
         "days": "天",
@@ -455,17 +485,17 @@ TRANSLATIONS = {
         "moderate": "中等相关",
         "weak": "弱相关",
         "negative": "负相关",
-        "recent_news": "📰 最新消息",
+        "recent_news": "最新消息",
         "no_news": "暂无新闻",
-        "raw_data": "📋 原始数据",
+        "raw_data": "原始数据",
         "view_data": "查看数据",
         "merged_data": "查看合并数据",
-        "export_data": "💾 导出数据",
-        "download": "📥 下载",
+        "export_data": "导出数据",
+        "download": "下载",
         "loading_data": "加载数据中...",
         "error_loading": "无法加载数据，请稍后再试。",
         "error_fetching": "获取数据时出错",
-        "economic_analysis": "🌍 各大洲经济分析",
+        "economic_analysis": "各大洲经济分析",
         "select_continent": "选择一个大洲",
         "generate_analysis": "生成分析",
         "analysis_disclaimer": "此分析由AI生成，不应被视为财务建议。",
@@ -485,7 +515,7 @@ TRANSLATIONS = {
         "economic_indicators": "关键经济指标",
         "ai_analysis": "AI经济分析",
         "last_analysis": "分析生成于",
-        "credit_risk": "🏦 信用风险分析",
+        "credit_risk": "信用风险分析",
         "credit_risk_title": "信用风险分析",
         "enter_ticker": "输入股票代码",
         "analyze_button": "分析信用风险",
@@ -516,13 +546,13 @@ TRANSLATIONS = {
     
     "Русский": {
         "page_title": "Финансовая панель",
-        "main_title": "📈 Финансовая панель",
+        "main_title": "Финансовая панель",
         "comparison": "Сравнение",
         "vs": "и",
         "years": "лет",
         "over": "за",
-        "settings": "⚙️ Настройки",
-        "language": "🌐 Язык",
+        "settings": "Настройки",
+        "language": "Язык",
         "asset_selection": "Выбор активов",
         "first_asset": "Первый актив",
         "second_asset": "Второй актив",
@@ -532,31 +562,36 @@ TRANSLATIONS = {
         "show_normalized": "Показать нормализованные цены",
         "show_drawdown": "Показать просадки",
         "show_volume": "Показать объёмы",
-        "refresh_data": "🔄 Обновить данные",
+        "show_correlation": "Показать корреляцию",
+        "show_news": "Показать новости",
+        "show_raw_data": "Показать исходные данные",
+        "show_all_raw_data": "Показать все столбцы и строки",
+        "refresh_data": "Обновить данные",
         "last_update": "Последнее обновление",
         "created_with": "Панель создана с помощью Streamlit",
         "cryptocurrencies": "Криптовалюты",
         "indices": "Индексы",
         "tech_stocks": "Технологические акции",
         "commodities": "Сырьевые товары",
-        "key_metrics": "📊 Ключевые показатели",
+        "key_metrics": "Ключевые показатели",
         "return": "Доходность",
         "volatility": "Волатильность",
         "current_price": "Текущая цена",
         "sharpe": "Шарп",
-        "performance_comparison": "📈 Сравнение эффективности",
+        "performance_comparison": "Сравнение эффективности",
         "normalized_prices": "Нормализованные цены",
         "prices": "Цены",
         "normalized_price_zscore": "Нормализованная цена (z-score)",
         "price_usd": "Цена ($)",
         "date": "Дата",
         "asset": "Актив",
-        "drawdowns_title": "📉 Просадки (потери от максимума)",
+        "drawdowns_title": "Просадки (потери от максимума)",
         "drawdowns_from_ath": "Просадки от исторических максимумов",
         "max_drawdown": "Макс. просадка",
-        "trading_volumes": "📊 Объёмы торгов",
+        "trading_volumes": "Объёмы торгов",
         "volume": "Объём",
-        "correlation_analysis": "🔗 Анализ корреляции",
+        "volume_periods": {"D": "за день", "W": "за неделю", "MS": "за месяц", "QS": "за квартал"},
+        "correlation_analysis": "Анализ корреляции",
         "overall_correlation": "Общая корреляция",
         "rolling_correlation": "Скользящая корреляция",
         "days": "дней",
@@ -565,17 +600,17 @@ TRANSLATIONS = {
         "moderate": "Умеренная корреляция",
         "weak": "Слабая корреляция",
         "negative": "Отрицательная корреляция",
-        "recent_news": "📰 Последние новости",
+        "recent_news": "Последние новости",
         "no_news": "Новостей нет",
-        "raw_data": "📋 Исходные данные",
+        "raw_data": "Исходные данные",
         "view_data": "Посмотреть данные",
         "merged_data": "Посмотреть объединённые данные",
-        "export_data": "💾 Экспорт данных",
-        "download": "📥 Скачать",
+        "export_data": "Экспорт данных",
+        "download": "Скачать",
         "loading_data": "Загрузка данных...",
         "error_loading": "Невозможно загрузить данные. Попробуйте позже.",
         "error_fetching": "Ошибка при загрузке",
-        "economic_analysis": "🌍 Экономический Анализ по Континентам",
+        "economic_analysis": "Экономический Анализ по Континентам",
         "select_continent": "Выберите континент",
         "generate_analysis": "Создать анализ",
         "analysis_disclaimer": "Этот анализ создан ИИ и не является финансовой рекомендацией.",
@@ -595,7 +630,7 @@ TRANSLATIONS = {
         "economic_indicators": "Ключевые Экономические Показатели",
         "ai_analysis": "ИИ Экономический Анализ",
         "last_analysis": "Анализ создан",
-        "credit_risk": "🏦 Анализ Кредитного Риска",
+        "credit_risk": "Анализ Кредитного Риска",
         "credit_risk_title": "Анализ Кредитного Риска",
         "enter_ticker": "Введите тикер",
         "analyze_button": "Анализировать Кредитный Риск",
@@ -626,13 +661,13 @@ TRANSLATIONS = {
     
     "العربية": {
         "page_title": "لوحة المعلومات المالية",
-        "main_title": "📈 لوحة المعلومات المالية",
+        "main_title": "لوحة المعلومات المالية",
         "comparison": "مقارنة",
         "vs": "مقابل",
         "years": "سنوات",
         "over": "خلال",
-        "settings": "⚙️ الإعدادات",
-        "language": "🌐 اللغة",
+        "settings": "الإعدادات",
+        "language": "اللغة",
         "asset_selection": "اختيار الأصول",
         "first_asset": "الأصل الأول",
         "second_asset": "الأصل الثاني",
@@ -642,31 +677,36 @@ TRANSLATIONS = {
         "show_normalized": "عرض الأسعار المعيارية",
         "show_drawdown": "عرض التراجعات",
         "show_volume": "عرض أحجام التداول",
-        "refresh_data": "🔄 تحديث البيانات",
+        "show_correlation": "عرض الارتباط",
+        "show_news": "عرض الأخبار",
+        "show_raw_data": "عرض البيانات الخام",
+        "show_all_raw_data": "عرض جميع الأعمدة والصفوف",
+        "refresh_data": "تحديث البيانات",
         "last_update": "آخر تحديث",
         "created_with": "لوحة معلومات تم إنشاؤها باستخدام Streamlit",
         "cryptocurrencies": "العملات المشفرة",
         "indices": "المؤشرات",
         "tech_stocks": "أسهم التكنولوجيا",
         "commodities": "السلع",
-        "key_metrics": "📊 المؤشرات الرئيسية",
+        "key_metrics": "المؤشرات الرئيسية",
         "return": "العائد",
         "volatility": "التقلب",
         "current_price": "السعر الحالي",
         "sharpe": "شارب",
-        "performance_comparison": "📈 مقارنة الأداء",
+        "performance_comparison": "مقارنة الأداء",
         "normalized_prices": "الأسعار المعيارية",
         "prices": "الأسعار",
         "normalized_price_zscore": "السعر المعياري (z-score)",
         "price_usd": "السعر ($)",
         "date": "التاريخ",
         "asset": "الأصل",
-        "drawdowns_title": "📉 التراجعات (الخسائر من الذروة)",
+        "drawdowns_title": "التراجعات (الخسائر من الذروة)",
         "drawdowns_from_ath": "التراجعات من أعلى المستويات التاريخية",
         "max_drawdown": "أقصى تراجع",
-        "trading_volumes": "📊 أحجام التداول",
+        "trading_volumes": "أحجام التداول",
         "volume": "الحجم",
-        "correlation_analysis": "🔗 تحليل الارتباط",
+        "volume_periods": {"D": "يومي", "W": "أسبوعي", "MS": "شهري", "QS": "ربع سنوي"},
+        "correlation_analysis": "تحليل الارتباط",
         "overall_correlation": "الارتباط الكلي",
         "rolling_correlation": "الارتباط المتحرك",
         "days": "يوم",
@@ -675,17 +715,17 @@ TRANSLATIONS = {
         "moderate": "ارتباط معتدل",
         "weak": "ارتباط ضعيف",
         "negative": "ارتباط سلبي",
-        "recent_news": "📰 آخر الأخبار",
+        "recent_news": "آخر الأخبار",
         "no_news": "لا توجد أخبار متاحة",
-        "raw_data": "📋 البيانات الخام",
+        "raw_data": "البيانات الخام",
         "view_data": "عرض البيانات",
         "merged_data": "عرض البيانات المدمجة",
-        "export_data": "💾 تصدير البيانات",
-        "download": "📥 تحميل",
+        "export_data": "تصدير البيانات",
+        "download": "تحميل",
         "loading_data": "جاري تحميل البيانات...",
         "error_loading": "تعذر تحميل البيانات. يرجى المحاولة مرة أخرى لاحقاً.",
         "error_fetching": "خطأ في جلب",
-        "economic_analysis": "🌍 التحليل الاقتصادي حسب القارة",
+        "economic_analysis": "التحليل الاقتصادي حسب القارة",
         "select_continent": "اختر قارة",
         "generate_analysis": "إنشاء التحليل",
         "analysis_disclaimer": "هذا التحليل تم إنشاؤه بواسطة الذكاء الاصطناعي ولا ينبغي اعتباره نصيحة مالية.",
@@ -705,7 +745,7 @@ TRANSLATIONS = {
         "economic_indicators": "المؤشرات الاقتصادية الرئيسية",
         "ai_analysis": "التحليل الاقتصادي بالذكاء الاصطناعي",
         "last_analysis": "تم إنشاء التحليل في",
-        "credit_risk": "🏦 تحليل مخاطر الائتمان",
+        "credit_risk": "تحليل مخاطر الائتمان",
         "credit_risk_title": "تحليل مخاطر الائتمان",
         "enter_ticker": "أدخل رمز السهم",
         "analyze_button": "تحليل مخاطر الائتمان",
@@ -738,10 +778,44 @@ TRANSLATIONS = {
 # Language configuration (RTL support)
 RTL_LANGUAGES = ["العربية"]
 
+# Icon shown in front of some translated titles, shared by every language
+TRANSLATION_ICONS = {
+    "main_title": "📈 ",
+    "settings": "⚙️ ",
+    "language": "🌐 ",
+    "refresh_data": "🔄 ",
+    "key_metrics": "📊 ",
+    "performance_comparison": "📈 ",
+    "drawdowns_title": "📉 ",
+    "trading_volumes": "📊 ",
+    "correlation_analysis": "🔗 ",
+    "recent_news": "📰 ",
+    "raw_data": "📋 ",
+    "export_data": "💾 ",
+    "download": "📥 ",
+    "economic_analysis": "🌍 ",
+    "credit_risk": "🏦 "
+}
+
+# Texts of each language, with missing keys already falling back to English and icons prepended
+MERGED_TRANSLATIONS = {
+    lang: {
+        key: TRANSLATION_ICONS.get(key, "") + text if isinstance(text, str) else text
+        for key, text in {**TRANSLATIONS["English"], **texts}.items()
+    }
+    for lang, texts in TRANSLATIONS.items()
+}
+
+# Language selectbox options and the position of each language, built once
+LANGUAGES = tuple(TRANSLATIONS.keys())
+LANGUAGE_INDEX = {lang: idx for idx, lang in enumerate(LANGUAGES)}
+
+# Texts of the current run's language, bound once after session state is initialized
+current_texts = MERGED_TRANSLATIONS["English"]
+
 def get_text(key: str) -> str:
     """Get translated text for the current language."""
-    lang = st.session_state.get("language", "English")
-    return TRANSLATIONS.get(lang, TRANSLATIONS["English"]).get(key, key)
+    return current_texts.get(key, key)
 
 def t(key: str) -> str:
     """Shorthand for get_text."""
@@ -763,18 +837,15 @@ st.set_page_config(
 # =============================================================================
 if "language" not in st.session_state:
     st.session_state.language = "English"
+current_texts = MERGED_TRANSLATIONS[st.session_state.language]
 
 
 # =============================================================================
 # CUSTOM CSS
 # =============================================================================
-def apply_custom_css():
-    """Apply custom CSS including RTL support and professional parchment theme."""
-    is_rtl = st.session_state.language in RTL_LANGUAGES
-    direction = "rtl" if is_rtl else "ltr"
-    text_align = "right" if is_rtl else "left"
-    
-    st.markdown(f"""
+def build_custom_css(direction: str, text_align: str) -> str:
+    """Build the professional parchment theme CSS for one text direction."""
+    return f"""
     <style>
         @import url('https://fonts.googleapis.com/css2?family=Libre+Baskerville:wght@400;700&family=Source+Sans+Pro:wght@400;600;700&display=swap');
         
@@ -969,7 +1040,17 @@ def apply_custom_css():
         .risk-high {{ background-color: #f8d7da; border: 2px solid #dc3545; }}
         .risk-very-high {{ background-color: #721c24; border: 2px solid #721c24; color: white; }}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Stylesheet per text direction (keyed by is_rtl), formatted once at import
+CUSTOM_CSS = {
+    False: build_custom_css("ltr", "left"),
+    True: build_custom_css("rtl", "right")
+}
+
+def apply_custom_css():
+    """Apply custom CSS including RTL support and professional parchment theme."""
+    st.markdown(CUSTOM_CSS[st.session_state.language in RTL_LANGUAGES], unsafe_allow_html=True)
 
 apply_custom_css()
 
@@ -1005,63 +1086,409 @@ ASSETS = {
     }
 }
 
-ALL_ASSETS = {}
-for category, assets in ASSETS.items():
-    ALL_ASSETS.update(assets)
+# Read-only lookups, built once at import and safe to share across threads
+ALL_ASSETS = MappingProxyType({ticker: name for assets in ASSETS.values() for ticker, name in assets.items()})
+TICKER_TO_NAME = ALL_ASSETS
+NAME_TO_TICKER = MappingProxyType({name: ticker for ticker, name in ALL_ASSETS.items()})
+
+# Sidebar selectbox options and the position of each name, built once
+ASSET_NAMES = tuple(NAME_TO_TICKER.keys())
+ASSET_NAME_INDEX = {name: idx for idx, name in enumerate(ASSET_NAMES)}
+
+# Window of the rolling correlation chart, in trading days
+CORRELATION_WINDOW = 30
+
+# Upper bounds of the correlation interpretation buckets and the translation key of each bucket
+CORRELATION_THRESHOLDS = (-0.3, 0.3, 0.7)
+CORRELATION_KEYS = ("negative", "weak", "moderate", "strong_positive")
+
+# Charts are thinned to about this many points per trace before being sent to the browser
+MAX_CHART_POINTS = 800
 
-TICKER_TO_NAME = {ticker: name for ticker, name in ALL_ASSETS.items()}
-NAME_TO_TICKER = {name: ticker for ticker, name in ALL_ASSETS.items()}
+# Most recent days shown by the raw-data tables unless every row is requested
+RAW_DATA_ROWS = 500
+
+# Built figures kept by the chart cache (one per combination of assets, period, options and language)
+FIGURE_CACHE_ENTRIES = 64
+
+# Longest history selectable in the sidebar; the on-disk cache always holds this much
+MAX_YEARS = 10
+
+# Daily price histories are persisted here and shared by every session and worker
+PRICE_CACHE_DIR = Path(".yf_cache")
+PRICE_CACHE_TTL = 3600  # length of a price snapshot window; histories are topped up once per window
+
+# Touched by the "Refresh data" button; disk cache files written before it count as stale
+REFRESH_MARKER = PRICE_CACHE_DIR / "refresh"
+
+# Credit risk inputs are persisted here too; fundamentals change slowly, so they are kept for a day
+CREDIT_CACHE_DIR = PRICE_CACHE_DIR / "credit"
+CREDIT_CACHE_TTL = 86400
+
+# Years of prices the credit model measures equity volatility over
+CREDIT_PRICE_YEARS = 2
+
+# Columns of a cached daily history; the raw-data table and exports show all of them
+HISTORY_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+
+# Only these columns are read by the metrics and charts, so only they are sliced per period
+PRICE_COLUMNS = ['Date', 'Close', 'Volume']
+
+# Fields of yfinance's `info` dict kept by get_asset_info (the full dict has hundreds of keys)
+ASSET_INFO_FIELDS = ("shortName", "longName", "marketCap", "currency", "sector", "industry",
+                     "trailingPE", "dividendYield")
 
 
 # =============================================================================
 # DATA LOADING FUNCTIONS
 # =============================================================================
-@st.cache_data(ttl=3600)
-def load_asset_data(ticker: str, years: int) -> pd.DataFrame:
-    """Load historical data for an asset."""
-    today = datetime.today()
-    start_date = today - timedelta(days=365 * years)
+def run_in_threads(func, items: list, max_workers: int = None) -> list:
+    """Map func over items in a thread pool, keeping the Streamlit script context."""
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=max_workers or len(items) or 1,
+                            initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        return list(executor.map(func, items))
+
+
+def _download_histories(tickers: list, start, end) -> dict:
+    """
+    Download daily bars for several tickers in a single batched yfinance request.
     
-    try:
-        data = yf.Ticker(ticker).history(start=start_date, end=today)
+    Returns:
+    --------
+    dict - ticker -> DataFrame with HISTORY_COLUMNS (empty if no data)
+    """
+    data = yf.download(tickers, start=start, end=end, group_by='ticker', auto_adjust=True,
+                       actions=True, threads=True, progress=False)
+    
+    histories = {}
+    for ticker in tickers:
         if data.empty:
-            return pd.DataFrame()
+            histories[ticker] = pd.DataFrame()
+            continue
         
-        df = pd.DataFrame(data)
-        df.reset_index(inplace=True)
-        df['Date'] = pd.to_datetime(df['Date']).dt.date
-        return df
+        df = data[ticker] if isinstance(data.columns, pd.MultiIndex) else data
+        # reindex fixes the column order and adds the action columns when yfinance has none
+        df = df.loc[df['Close'].notna()].reset_index().reindex(columns=HISTORY_COLUMNS)
+        df['Date'] = pd.to_datetime(df['Date']).dt.tz_localize(None)
+        df['Volume'] = df['Volume'].fillna(0).astype(np.int64)
+        df[['Dividends', 'Stock Splits']] = df[['Dividends', 'Stock Splits']].fillna(0.0)
+        histories[ticker] = df
+    return histories
+
+
+def _history_cache_path(ticker: str) -> Path:
+    """Parquet file holding the cached history of a ticker."""
+    return PRICE_CACHE_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)}.parquet"
+
+
+def _read_cached_history(path: Path):
+    """Cached history stored at path, or None if it is missing, unreadable or in an older layout."""
+    try:
+        cached = pd.read_parquet(path)
+    except Exception:
+        return None
+    # Files from before the full column set was stored are rebuilt from scratch
+    if list(cached.columns) != HISTORY_COLUMNS:
+        return None
+    cached['Date'] = pd.to_datetime(cached['Date'])
+    return cached
+
+
+def _write_atomically(path: Path, write) -> None:
+    """Write a cache file through a temporary file, so a reader or a crash never sees it half written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_cached_history(path: Path, history: pd.DataFrame) -> None:
+    """Write a history to the on-disk cache."""
+    _write_atomically(path, lambda tmp_path: history.to_parquet(tmp_path, index=False, compression="zstd"))
+
+
+def last_refresh() -> float:
+    """Time of the last "Refresh data" click (0 if there was none)."""
+    try:
+        return REFRESH_MARKER.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _has_new_actions(cached: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """Whether the downloaded bars record a dividend or split that the cached ones do not."""
+    known = cached.loc[cached['Date'] >= fresh['Date'].min(), ['Dividends', 'Stock Splits']]
+    return not np.allclose(fresh[['Dividends', 'Stock Splits']].to_numpy().sum(axis=0),
+                           known.to_numpy().sum(axis=0))
+
+
+def load_cached_histories(tickers: list, snapshot: int) -> dict:
+    """
+    Return up to MAX_YEARS of daily history per ticker from the on-disk cache.
+    
+    A history written during the given snapshot window, and after the last "Refresh
+    data" click, is returned without any network access. Otherwise only the bars newer
+    than the last cached one are downloaded; the last cached bar is fetched again since
+    it may have been an intraday snapshot. Tickers that need the same start date share
+    one batched download.
+    
+    Prices are split and dividend adjusted, and Yahoo re-adjusts the whole history when
+    a new action occurs, so a ticker whose new bars bring one is downloaded in full again.
+    """
+    today = datetime.today()
+    first_date = (today - timedelta(days=365 * MAX_YEARS)).date()
+    fresh_since = max(snapshot * PRICE_CACHE_TTL, last_refresh())
+    histories = {}
+    stale = {}
+    
+    for ticker in tickers:
+        path = _history_cache_path(ticker)
+        cached = _read_cached_history(path)
+        if cached is not None and path.stat().st_mtime >= fresh_since:
+            histories[ticker] = cached
+        else:
+            stale[ticker] = cached
+    
+    by_start = {}
+    for ticker, cached in stale.items():
+        start = cached['Date'].max() if cached is not None else first_date
+        by_start.setdefault(start, []).append(ticker)
+    
+    rebuild = []
+    for start, batch in by_start.items():
+        for ticker, fresh in _download_histories(batch, start=start, end=today).items():
+            cached = stale[ticker]
+            if fresh.empty:
+                histories[ticker] = cached if cached is not None else fresh
+                continue
+            
+            if cached is not None:
+                if _has_new_actions(cached, fresh):
+                    rebuild.append(ticker)
+                    continue
+                fresh = pd.concat([cached[cached['Date'] < fresh['Date'].min()], fresh], ignore_index=True)
+            histories[ticker] = fresh
+    
+    if rebuild:
+        for ticker, fresh in _download_histories(rebuild, start=first_date, end=today).items():
+            # Without a rebuilt history the old one is served but not rewritten, so it is retried
+            histories[ticker] = fresh if not fresh.empty else stale[ticker]
+    
+    for ticker in stale:
+        history = histories[ticker]
+        if history is not stale[ticker] and not history.empty:
+            history = history[history['Date'] >= pd.Timestamp(first_date)].reset_index(drop=True)
+            _write_cached_history(_history_cache_path(ticker), history)
+            histories[ticker] = history
+    
+    return histories
+
+
+# Every in-memory price cache below is keyed on the snapshot window, so a run reads all of
+# its prices, metrics and figures from one load and they all move to new data together.
+# Their TTL only evicts entries of past windows.
+def price_snapshot() -> int:
+    """Index of the current PRICE_CACHE_TTL window."""
+    return int(time.time() // PRICE_CACHE_TTL)
+
+
+def refresh_all_data() -> None:
+    """Make the next run fetch fresh data, bypassing the in-memory and on-disk caches."""
+    PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    REFRESH_MARKER.touch()
+    st.cache_data.clear()
+    # The comparison figures are resources, which st.cache_data.clear() leaves in place
+    for build_figure in (build_main_figure, build_drawdown_figure, build_volume_figure, build_correlation_figure):
+        build_figure.clear()
+
+
+def period_start(years: int) -> pd.Timestamp:
+    """First date shown for a period of `years` years."""
+    return pd.Timestamp(date.today() - timedelta(days=365 * years))
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def refresh_histories(tickers: tuple, snapshot: int) -> None:
+    """Bring the on-disk histories of several tickers up to date with one batched download per window."""
+    try:
+        load_cached_histories(list(tickers), snapshot)
+    except Exception:
+        # load_full_history retries and reports the failure per ticker
+        pass
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def load_full_history(ticker: str, snapshot: int) -> pd.DataFrame:
+    """
+    MAX_YEARS of a ticker's PRICE_COLUMNS kept in memory, so a new period is only a slice of it.
+    
+    Close is held as float32, which halves the bytes every metric and chart reads; the
+    statistics upcast to float64 before reducing. Volume stays int64, as crypto volumes
+    overflow int32. The other HISTORY_COLUMNS stay on disk at full precision and are read
+    by load_full_asset_data when needed.
+    """
+    try:
+        history = load_cached_histories([ticker], snapshot)[ticker]
+        if history.empty:
+            return history
+        return history[PRICE_COLUMNS].astype({'Close': np.float32})
     except Exception as e:
         st.error(f"{t('error_fetching')} {ticker}: {e}")
         return pd.DataFrame()
 
 
+def load_assets_data(tickers: list, years: int, snapshot: int) -> dict:
+    """
+    Load historical data for several assets, downloading any stale histories in one batch.
+    
+    Returns:
+    --------
+    dict - ticker -> DataFrame with PRICE_COLUMNS (empty if unavailable)
+    """
+    refresh_histories(tuple(sorted(set(tickers))), snapshot)
+    return {ticker: load_asset_data(ticker, years, snapshot) for ticker in tickers}
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def load_asset_data(ticker: str, years: int, snapshot: int) -> pd.DataFrame:
+    """Load historical data for an asset."""
+    history = load_full_history(ticker, snapshot)
+    if history.empty:
+        return pd.DataFrame()
+    return history[history['Date'] >= period_start(years)].reset_index(drop=True)
+
+
+def load_full_asset_data(ticker: str, years: int) -> pd.DataFrame:
+    """
+    Load historical data for an asset with every HISTORY_COLUMNS column, for display and export.
+    
+    Read straight from the on-disk cache, which load_full_history has already brought up
+    to date, so the extra columns are never held in memory.
+    """
+    history = _read_cached_history(_history_cache_path(ticker))
+    if history is None:
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    return history[history['Date'] >= period_start(years)].reset_index(drop=True)
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def export_asset_data(ticker: str, years: int, snapshot: int, file_format: str = "csv") -> bytes:
+    """Encode an asset's history for download ("csv" or "parquet"), once per (ticker, years)."""
+    df = load_full_asset_data(ticker, years)
+    if file_format == "parquet":
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+    return df.to_csv(index=False).encode("utf-8")
+
+
 @st.cache_data(ttl=3600)
 def get_asset_info(ticker: str) -> dict:
-    """Get detailed asset information."""
+    """Get detailed asset information, limited to ASSET_INFO_FIELDS."""
     try:
         info = yf.Ticker(ticker).info
-        return info
+        return {key: info.get(key) for key in ASSET_INFO_FIELDS}
     except:
         return {}
 
 
+def lttb_positions(values: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Row positions kept by Largest-Triangle-Three-Buckets downsampling.
+    
+    The first and last rows are always kept. Every bucket in between contributes the
+    row forming the largest triangle with the previous pick and the next bucket's
+    average, so peaks and troughs survive. Row position stands in for x since the
+    series are daily. NaNs are treated as 0 when choosing rows.
+    """
+    y = np.nan_to_num(np.asarray(values, dtype=np.float64))
+    n = len(y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    positions = np.empty(n_out, dtype=np.int64)
+    positions[0], positions[-1] = 0, n - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (end + next_end - 1) / 2
+        avg_y = y[end:next_end].mean()
+        xs = np.arange(start, end)
+        area = np.abs((prev - avg_x) * (y[start:end] - y[prev]) - (prev - xs) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        positions[i + 1] = prev
+    return positions
+
+
+def downsample_for_chart(df: pd.DataFrame, value_column: str, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """Thin a frame with LTTB on `value_column` so a line chart plots at most ~max_points rows."""
+    if len(df) <= max_points:
+        return df
+    return df.iloc[lttb_positions(df[value_column].to_numpy(), max_points)]
+
+
+def aggregate_volume_for_chart(df: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """
+    Sum daily volumes into bars of `freq` ("D" keeps the daily bars).
+    
+    Unlike thinning, every day's turnover is still counted in the bar of its period.
+    """
+    if freq == "D":
+        return df
+    return df.resample(freq, on='Date')['Volume'].sum().reset_index()
+
+
+def volume_chart_frequency(frames: list, max_points: int = MAX_CHART_POINTS) -> str:
+    """
+    Shortest bar period ("D", "W", "MS" or "QS") keeping every frame within ~max_points bars.
+    
+    It is chosen from the longest frame and shared by all of them, so subplots that share
+    an x-axis also share their unit.
+    """
+    longest = max(frames, key=len)
+    for freq in ("D", "W", "MS"):
+        if len(aggregate_volume_for_chart(longest, freq)) <= max_points:
+            return freq
+    return "QS"
+
+
+def chart_dates(dates: pd.Series) -> np.ndarray:
+    """Day-precision dates, which plotly serializes as short YYYY-MM-DD strings."""
+    return dates.to_numpy().astype('datetime64[D]')
+
+
 def normalize_series(series: pd.Series) -> pd.Series:
     """Normalize a series (z-score)."""
-    return (series - series.mean()) / series.std()
+    values = series.to_numpy(dtype=np.float64)
+    normalized = values - np.nanmean(values)
+    normalized /= np.nanstd(values, ddof=1)
+    return pd.Series(normalized, index=series.index, name=series.name)
 
 
 def calculate_returns(prices: pd.Series) -> float:
     """Calculate total return in percentage."""
     if len(prices) < 2:
         return 0.0
-    return ((prices.iloc[-1] / prices.iloc[0]) - 1) * 100
+    return ((prices.iat[-1] / prices.iat[0]) - 1) * 100
+
+
+def daily_returns(prices: pd.Series) -> np.ndarray:
+    """Simple daily returns as a raw float64 array, computed once and shared by the stats below."""
+    close = prices.to_numpy(dtype=np.float64)
+    returns = np.diff(close)
+    returns /= close[:-1]
+    return returns
 
 
-def calculate_volatility(prices: pd.Series, annualize: bool = True) -> float:
-    """Calculate volatility (standard deviation of returns)."""
-    returns = prices.pct_change().dropna()
-    vol = returns.std()
+def calculate_volatility(returns: np.ndarray, annualize: bool = True) -> float:
+    """Calculate volatility (standard deviation of daily returns)."""
+    vol = returns.std(ddof=1)
     if annualize:
         vol *= np.sqrt(252)
     return vol * 100
@@ -1069,31 +1496,320 @@ def calculate_volatility(prices: pd.Series, annualize: bool = True) -> float:
 
 def calculate_drawdown(prices: pd.Series) -> pd.Series:
     """Calculate drawdown from all-time high."""
-    peak = prices.cummax()
-    drawdown = (prices - peak) / peak * 100
-    return drawdown
+    values = prices.to_numpy(dtype=np.float64)
+    drawdown = np.maximum.accumulate(values)
+    np.divide(values, drawdown, out=drawdown)
+    drawdown -= 1.0
+    drawdown *= 100.0
+    return pd.Series(drawdown, index=prices.index, name=prices.name)
 
 
-def calculate_sharpe_ratio(prices: pd.Series, risk_free_rate: float = 0.04) -> float:
-    """Calculate simplified Sharpe ratio."""
-    returns = prices.pct_change().dropna()
+def calculate_max_drawdown(prices: pd.Series) -> float:
+    """Calculate the deepest drawdown in percentage without building the drawdown series."""
+    values = prices.to_numpy(dtype=np.float64)
+    if len(values) == 0:
+        return 0.0
+    return (np.min(values / np.maximum.accumulate(values)) - 1.0) * 100
+
+
+def calculate_sharpe_ratio(returns: np.ndarray, risk_free_rate: float = 0.04) -> float:
+    """Calculate simplified Sharpe ratio from daily returns."""
     excess_return = returns.mean() * 252 - risk_free_rate
-    volatility = returns.std() * np.sqrt(252)
+    volatility = returns.std(ddof=1) * np.sqrt(252)
     if volatility == 0:
-        return 0
+        return 0.0
     return excess_return / volatility
 
 
+def calculate_summary_stats(prices: pd.Series, risk_free_rate: float = 0.04) -> tuple:
+    """
+    Calculate total return, volatility and Sharpe ratio from one shared returns array.
+    
+    Returns:
+    --------
+    tuple - (total return %, annualized volatility %, Sharpe ratio)
+    """
+    if len(prices) < 3:
+        return (0.0, 0.0, 0.0)
+    
+    returns = daily_returns(prices)
+    return (calculate_returns(prices),
+            calculate_volatility(returns),
+            calculate_sharpe_ratio(returns, risk_free_rate))
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def compute_asset_metrics(ticker: str, years: int, snapshot: int) -> dict:
+    """
+    Compute every per-asset figure shown on the comparison tab in one cached call.
+    
+    Returns:
+    --------
+    dict with keys: return, volatility, sharpe, last_price, max_drawdown
+    """
+    df = load_asset_data(ticker, years, snapshot)
+    if df.empty:
+        return {}
+    
+    total_return, volatility, sharpe = calculate_summary_stats(df['Close'])
+    return {
+        'return': total_return,
+        'volatility': volatility,
+        'sharpe': sharpe,
+        # Shown to the cent, so read at full precision rather than from the float32 closes
+        'last_price': load_full_asset_data(ticker, years)['Close'].iat[-1],
+        'max_drawdown': calculate_max_drawdown(df['Close'])
+    }
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def build_price_frame(ticker: str, years: int, snapshot: int, normalized: bool) -> pd.DataFrame:
+    """Closes of an asset (z-scored if normalized) on its own trading days, thinned for the main chart."""
+    df = load_asset_data(ticker, years, snapshot)
+    close = df['Close']
+    if normalized:
+        close = normalize_series(close)
+    # float32 is ample for plotting and halves the arrays plotly sends to the browser
+    return downsample_for_chart(pd.DataFrame({'Date': df['Date'], 'Close': close.to_numpy(dtype=np.float32)}),
+                                value_column='Close')
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def build_drawdown_frame(ticker: str, years: int, snapshot: int) -> pd.DataFrame:
+    """Drawdown series of an asset, thinned for the drawdown chart."""
+    df = load_asset_data(ticker, years, snapshot)
+    drawdown = calculate_drawdown(df['Close']).to_numpy(dtype=np.float32)
+    return downsample_for_chart(pd.DataFrame({'Date': df['Date'], 'Drawdown': drawdown}), value_column='Drawdown')
+
+
+def rolling_correlation(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling Pearson correlation in one pass using windowed running sums.
+    
+    Windows containing a NaN in either input yield NaN, like pandas' rolling().corr().
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    out = np.full(len(x), np.nan)
+    if len(x) < window:
+        return out
+    
+    valid = np.isfinite(x) & np.isfinite(y)
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    
+    def window_sums(a: np.ndarray) -> np.ndarray:
+        cumsum = np.concatenate(([0.0], np.cumsum(a)))
+        return cumsum[window:] - cumsum[:-window]
+    
+    count = window_sums(valid.astype(np.float64))
+    sum_x, sum_y = window_sums(x), window_sums(y)
+    cov = window * window_sums(x * y) - sum_x * sum_y
+    var = (window * window_sums(x * x) - sum_x**2) * (window * window_sums(y * y) - sum_y**2)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.clip(cov / np.sqrt(var), -1.0, 1.0)
+    corr[count < window] = np.nan
+    out[window - 1:] = corr
+    return out
+
+
+def classify_correlation(value: float) -> str:
+    """Translation key of the interpretation bucket a correlation falls into."""
+    return CORRELATION_KEYS[bisect.bisect_left(CORRELATION_THRESHOLDS, value)]
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def load_correlation_data(ticker1: str, ticker2: str, years: int, snapshot: int, window: int = 30) -> pd.DataFrame:
+    """Daily returns of two assets on their common dates, with their rolling correlation."""
+    assets = load_assets_data([ticker1, ticker2], years, snapshot)
+    df1, df2 = assets[ticker1], assets[ticker2]
+    
+    merged_corr = pd.concat([df1.set_index('Date')['Close'].rename('Asset1'),
+                             df2.set_index('Date')['Close'].rename('Asset2')], axis=1, join='inner').reset_index()
+    # Both return columns from one array division (the first row has no previous close)
+    closes = merged_corr[['Asset1', 'Asset2']].to_numpy(dtype=np.float64)
+    returns = np.full_like(closes, np.nan)
+    np.divide(closes[1:], closes[:-1], out=returns[1:])
+    returns[1:] -= 1.0
+    merged_corr['Return1'] = returns[:, 0]
+    merged_corr['Return2'] = returns[:, 1]
+    merged_corr['Rolling_Corr'] = rolling_correlation(returns[:, 0], returns[:, 1], window)
+    return merged_corr
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def calculate_overall_correlation(ticker1: str, ticker2: str, years: int, snapshot: int) -> float:
+    """Correlation of two assets' daily returns over their whole common period."""
+    merged_corr = load_correlation_data(ticker1, ticker2, years, snapshot, CORRELATION_WINDOW)
+    return merged_corr['Return1'].corr(merged_corr['Return2'])
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared HTTP session so repeated requests reuse pooled keep-alive connections."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+@st.cache_resource
+def get_feed_validators() -> dict:
+    """Last ETag, Last-Modified and entries per feed URL, shared by all sessions for conditional GETs."""
+    return {}
+
+
 @st.cache_data(ttl=3600)
 def get_news(ticker: str) -> list:
-    """Get news via Yahoo Finance RSS."""
+    """
+    Get news via Yahoo Finance RSS, keeping only the title, link and publication date of each entry.
+    
+    The request is conditional on the validators of the previous download, so an
+    unchanged feed answers 304 with no body and the stored entries are reused.
+    """
+    url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}"
+    validators = get_feed_validators()
+    previous = validators.get(url)
+    
+    headers = {}
+    if previous:
+        if previous['etag']:
+            headers['If-None-Match'] = previous['etag']
+        if previous['modified']:
+            headers['If-Modified-Since'] = previous['modified']
+    
     try:
-        feed = feedparser.parse(f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}")
-        return feed.entries[:5]
+        response = get_http_session().get(url, headers=headers, timeout=5)
+        if response.status_code == 304 and previous:
+            return previous['entries']
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+        entries = [
+            {'title': entry.get('title', ''), 'link': entry.get('link', ''), 'published': entry.get('published')}
+            for entry in feed.entries[:5]
+        ]
+        validators[url] = {
+            'etag': response.headers.get('ETag'),
+            'modified': response.headers.get('Last-Modified'),
+            'entries': entries
+        }
+        return entries
     except:
         return []
 
 
+# =============================================================================
+# CHART FUNCTIONS
+# =============================================================================
+# Figures are cached as shared resources rather than pickled per call, so a rerun
+# with the same inputs skips building and validating them. Titles are translated,
+# so the language is part of every cache key. Callers must not modify the figures.
+@st.cache_resource(ttl=PRICE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+def build_main_figure(ticker1: str, ticker2: str, years: int, snapshot: int, normalized: bool, language: str) -> go.Figure:
+    """Price comparison chart of two assets."""
+    asset1_name, asset2_name = TICKER_TO_NAME[ticker1], TICKER_TO_NAME[ticker2]
+    # Each asset is plotted on its own trading days, so crypto weekends are kept
+    price1 = build_price_frame(ticker1, years, snapshot, normalized)
+    price2 = build_price_frame(ticker2, years, snapshot, normalized)
+    y_label = t("normalized_price_zscore") if normalized else t("price_usd")
+    
+    chart_title = f"{t('normalized_prices') if normalized else t('prices')}: {asset1_name} {t('vs')} {asset2_name}"
+    fig_main = go.Figure()
+    fig_main.add_trace(go.Scattergl(x=chart_dates(price1['Date']), y=price1['Close'], name=asset1_name,
+                                    mode='lines', line=dict(color='#C45B28')))
+    fig_main.add_trace(go.Scattergl(x=chart_dates(price2['Date']), y=price2['Close'], name=asset2_name,
+                                    mode='lines', line=dict(color='#1B6B4A')))
+    
+    fig_main.update_layout(
+        xaxis_title=t("date"), yaxis_title=y_label,
+        hovermode="x unified", height=450, template='plotly_white',
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
+        font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12),
+        title=dict(text=chart_title, font=dict(color='#2D2418', size=16)),
+        legend=dict(
+            orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5,
+            font=dict(color='#2D2418', size=12),
+            bgcolor='rgba(255,254,250,0.9)', title_text=t('asset')
+        ),
+        xaxis=dict(tickfont=dict(color='#3D3428')),
+        yaxis=dict(tickfont=dict(color='#3D3428'))
+    )
+    fig_main.update_traces(line=dict(width=2.5))
+    return fig_main
+
+
+@st.cache_resource(ttl=PRICE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+def build_drawdown_figure(ticker1: str, ticker2: str, years: int, snapshot: int, language: str) -> go.Figure:
+    """Drawdown chart of two assets."""
+    dd1 = build_drawdown_frame(ticker1, years, snapshot)
+    dd2 = build_drawdown_frame(ticker2, years, snapshot)
+    
+    fig_dd = go.Figure()
+    fig_dd.add_trace(go.Scattergl(x=chart_dates(dd1['Date']), y=dd1['Drawdown'], fill='tozeroy', name=TICKER_TO_NAME[ticker1],
+                                 line=dict(color='#C45B28', width=2), fillcolor='rgba(196, 91, 40, 0.25)'))
+    fig_dd.add_trace(go.Scattergl(x=chart_dates(dd2['Date']), y=dd2['Drawdown'], fill='tozeroy', name=TICKER_TO_NAME[ticker2],
+                                 line=dict(color='#1B6B4A', width=2), fillcolor='rgba(27, 107, 74, 0.25)'))
+    
+    fig_dd.update_layout(
+        title=dict(text=t("drawdowns_from_ath"), font=dict(color='#2D2418', size=16)),
+        xaxis_title=t("date"), yaxis_title="Drawdown (%)",
+        template='plotly_white', height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
+        font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12),
+        legend=dict(
+            orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5,
+            font=dict(color='#2D2418', size=12),
+            bgcolor='rgba(255,254,250,0.9)'
+        ),
+        xaxis=dict(tickfont=dict(color='#3D3428')),
+        yaxis=dict(tickfont=dict(color='#3D3428'))
+    )
+    return fig_dd
+
+
+@st.cache_resource(ttl=PRICE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+def build_volume_figure(ticker1: str, ticker2: str, years: int, snapshot: int, language: str) -> go.Figure:
+    """Trading volume chart of two assets, one subplot each."""
+    asset1_name, asset2_name = TICKER_TO_NAME[ticker1], TICKER_TO_NAME[ticker2]
+    df1, df2 = load_asset_data(ticker1, years, snapshot), load_asset_data(ticker2, years, snapshot)
+    freq = volume_chart_frequency([df1, df2])
+    vol1, vol2 = aggregate_volume_for_chart(df1, freq), aggregate_volume_for_chart(df2, freq)
+    period = t("volume_periods")[freq]
+    
+    fig_vol = make_subplots(rows=2, cols=1, shared_xaxes=True,
+                            subplot_titles=(f"{t('volume')} {asset1_name} ({period})",
+                                            f"{t('volume')} {asset2_name} ({period})"))
+    fig_vol.add_trace(go.Bar(x=chart_dates(vol1['Date']), y=vol1['Volume'].astype(np.float32), name=asset1_name, marker=dict(color='#C45B28')), row=1, col=1)
+    fig_vol.add_trace(go.Bar(x=chart_dates(vol2['Date']), y=vol2['Volume'].astype(np.float32), name=asset2_name, marker=dict(color='#1B6B4A')), row=2, col=1)
+    
+    fig_vol.update_layout(height=450, template='plotly_white', showlegend=False,
+                          paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
+                          font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12))
+    fig_vol.update_xaxes(tickfont=dict(color='#3D3428'))
+    fig_vol.update_yaxes(tickfont=dict(color='#3D3428'))
+    fig_vol.update_annotations(font=dict(color='#2D2418', size=14))
+    return fig_vol
+
+
+@st.cache_resource(ttl=PRICE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+def build_correlation_figure(ticker1: str, ticker2: str, years: int, snapshot: int, language: str) -> go.Figure:
+    """Rolling correlation chart of two assets."""
+    corr_plot = downsample_for_chart(load_correlation_data(ticker1, ticker2, years, snapshot, CORRELATION_WINDOW),
+                                     value_column='Rolling_Corr')
+    fig_corr = go.Figure(go.Scattergl(x=chart_dates(corr_plot['Date']), y=corr_plot['Rolling_Corr'].astype(np.float32), mode='lines',
+                                      line=dict(color='#C45B28', width=2.5)))
+    fig_corr.add_hline(y=0, line_dash="dash", line_color="#8B7355")
+    fig_corr.update_layout(
+        xaxis_title='Date', yaxis_title=t("overall_correlation"), height=300,
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
+        font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12),
+        title=dict(text=f"{t('rolling_correlation')} ({CORRELATION_WINDOW} {t('days')})",
+                   font=dict(color='#2D2418', size=14)),
+        xaxis=dict(tickfont=dict(color='#3D3428')),
+        yaxis=dict(tickfont=dict(color='#3D3428'))
+    )
+    return fig_corr
+
+
 # =============================================================================
 # CREDIT RISK FUNCTIONS (MERTON MODEL)
 # =============================================================================
@@ -1157,25 +1873,46 @@ def get_risk_category(pd_value: float) -> tuple:
         return ("very_high_risk", "risk-very-high")
 
 
-@st.cache_data(ttl=1800)
-def get_credit_risk_data(ticker: str) -> dict:
+def _credit_price_start() -> date:
+    """First date of the prices the credit model reads."""
+    return date.today() - timedelta(days=365 * CREDIT_PRICE_YEARS)
+
+
+def _credit_price_history(ticker: str, prices: pd.DataFrame = None) -> pd.DataFrame:
     """
-    Fetch all data needed for credit risk analysis.
+    Last CREDIT_PRICE_YEARS of daily history of a company, for its equity volatility.
     
-    Returns:
-    --------
-    dict with keys: market_cap, total_debt, cash, equity_volatility, company_name, success
+    Prices prefetched by prefetch_credit_prices are used as given. A ticker the price cache
+    already holds is read (and topped up) from there; otherwise only these years are
+    downloaded instead of the cache's MAX_YEARS.
     """
+    first_date = _credit_price_start()
+    if prices is not None:
+        hist = prices
+    elif _history_cache_path(ticker).exists():
+        hist = load_cached_histories([ticker], price_snapshot())[ticker]
+    else:
+        hist = _download_histories([ticker], start=first_date, end=datetime.today())[ticker]
+    if hist.empty:
+        return hist
+    return hist[hist['Date'] >= pd.Timestamp(first_date)]
+
+
+def _fetch_credit_risk_data(ticker: str, prices: pd.DataFrame = None) -> dict:
+    """Fetch the credit risk inputs of a company from Yahoo (see get_credit_risk_data)."""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        # The profile, balance sheet and price history are separate requests, so issue them
+        # concurrently (one Ticker each, as Ticker objects are not thread-safe)
+        info, balance_sheet, hist = run_in_threads(lambda load: load(), [
+            lambda: yf.Ticker(ticker).info,
+            lambda: yf.Ticker(ticker).balance_sheet,
+            lambda: _credit_price_history(ticker, prices)
+        ])
         
         # Get market cap
         market_cap = info.get('marketCap', None)
         
         # Get balance sheet data
-        balance_sheet = stock.balance_sheet
-        
         total_debt = None
         cash = None
         
@@ -1188,11 +1925,10 @@ def get_credit_risk_data(ticker: str) -> dict:
             elif 'Cash And Cash Equivalents' in bs.columns:
                 cash = bs['Cash And Cash Equivalents'].iloc[0]
         
-        # Calculate equity volatility from historical prices
-        hist = stock.history(period="2y")
+        # Calculate equity volatility from the last CREDIT_PRICE_YEARS of prices
         if not hist.empty and len(hist) > 20:
-            log_returns = np.log(hist['Close'] / hist['Close'].shift(1)).dropna()
-            daily_vol = log_returns.std()
+            log_returns = np.diff(np.log(hist['Close'].to_numpy(dtype=np.float64)))
+            daily_vol = log_returns.std(ddof=1)
             annual_vol = daily_vol * np.sqrt(252)
         else:
             annual_vol = None
@@ -1211,6 +1947,70 @@ def get_credit_risk_data(ticker: str) -> dict:
         return {'success': False, 'error': str(e)}
 
 
+def _credit_cache_path(ticker: str) -> Path:
+    """JSON file holding the cached credit risk inputs of a ticker."""
+    return CREDIT_CACHE_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)}.json"
+
+
+def _credit_cache_is_fresh(ticker: str) -> bool:
+    """Whether the credit JSON of a ticker is recent enough to be served without Yahoo."""
+    path = _credit_cache_path(ticker)
+    return path.exists() and path.stat().st_mtime >= max(time.time() - CREDIT_CACHE_TTL, last_refresh())
+
+
+def prefetch_credit_prices(tickers: list) -> dict:
+    """
+    Download in one batch the prices of the companies whose credit data must be fetched.
+    
+    Only tickers without a fresh credit JSON and absent from the price cache are included,
+    since the others are served from disk.
+    
+    Returns:
+    --------
+    dict - ticker -> last CREDIT_PRICE_YEARS of history, for get_credit_risk_data's `_prices`
+    """
+    missing = [ticker for ticker in tickers
+               if not _credit_cache_is_fresh(ticker) and not _history_cache_path(ticker).exists()]
+    if not missing:
+        return {}
+    try:
+        return _download_histories(missing, start=_credit_price_start(), end=datetime.today())
+    except Exception:
+        # Each company falls back to its own download
+        return {}
+
+
+@st.cache_data(ttl=1800)
+def get_credit_risk_data(ticker: str, _prices: pd.DataFrame = None) -> dict:
+    """
+    Fetch all data needed for credit risk analysis.
+    
+    Successful results are persisted on disk for CREDIT_CACHE_TTL, so restarts and
+    other workers skip the Yahoo requests; failures are always retried, and so is
+    everything stored before the last "Refresh data" click. `_prices` optionally
+    supplies the price history from prefetch_credit_prices (it is not part of the
+    cache key).
+    
+    Returns:
+    --------
+    dict with keys: market_cap, total_debt, cash, equity_volatility, company_name, success
+    """
+    path = _credit_cache_path(ticker)
+    if _credit_cache_is_fresh(ticker):
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # An unreadable file is a cache miss and is rewritten below
+            pass
+    
+    data = _fetch_credit_risk_data(ticker, _prices)
+    if data.get('success', False):
+        # NumPy scalars from yfinance frames are written as plain floats
+        text = json.dumps(data, default=float)
+        _write_atomically(path, lambda tmp_path: Path(tmp_path).write_text(text, encoding="utf-8"))
+    return data
+
+
 # =============================================================================
 # AI ECONOMIC ANALYSIS FUNCTIONS
 # =============================================================================
@@ -1247,18 +2047,37 @@ CONTINENT_INDICATORS = {
     }
 }
 
+# Groq chat completion endpoint and model used for the analysis
+GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "llama-3.3-70b-versatile"
 
-def get_continent_data(continent_key: str) -> dict:
-    """Fetch recent performance data for continent indices."""
+# Instruction prepended to the prompt so the analysis comes back in the UI language
+ANALYSIS_LANGUAGE_INSTRUCTIONS = {
+    "English": "Respond in English.",
+    "Français": "Réponds en français.",
+    "Español": "Responde en español.",
+    "中文": "请用中文回复。",
+    "Русский": "Отвечай на русском языке.",
+    "العربية": "الرجاء الرد باللغة العربية."
+}
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def _load_continent_data(continent_key: str) -> dict:
+    """Fetch recent performance data for continent indices, all in one batched request."""
     indicators = CONTINENT_INDICATORS.get(continent_key, {})
+    tickers = indicators.get("indices", [])
     results = {}
     
-    for ticker, name in zip(indicators.get("indices", []), indicators.get("names", [])):
+    data = yf.download(tickers, period="1mo", group_by='ticker', auto_adjust=True,
+                       threads=True, progress=False)
+    
+    for ticker, name in zip(tickers, indicators.get("names", [])):
         try:
-            data = yf.Ticker(ticker).history(period="1mo")
-            if not data.empty:
-                current = data['Close'].iloc[-1]
-                month_ago = data['Close'].iloc[0]
+            close = (data[ticker] if isinstance(data.columns, pd.MultiIndex) else data)['Close'].dropna()
+            if not close.empty:
+                current = close.iat[-1]
+                month_ago = close.iat[0]
                 change_pct = ((current - month_ago) / month_ago) * 100
                 results[name] = {
                     "current": current,
@@ -1270,6 +2089,14 @@ def get_continent_data(continent_key: str) -> dict:
     return results
 
 
+def get_continent_data(continent_key: str) -> dict:
+    """Recent performance data for continent indices (empty if Yahoo fails; the failure is not cached)."""
+    try:
+        return _load_continent_data(continent_key)
+    except Exception:
+        return {}
+
+
 def generate_economic_analysis(continent_key: str, continent_name: str, api_key: str, language: str = "English") -> str:
     """Generate economic analysis using Groq API with Llama 3."""
     
@@ -1283,14 +2110,7 @@ def generate_economic_analysis(continent_key: str, continent_name: str, api_key:
     
     countries = ", ".join(indicators.get("countries", []))
     
-    lang_instruction = {
-        "English": "Respond in English.",
-        "Français": "Réponds en français.",
-        "Español": "Responde en español.",
-        "中文": "请用中文回复。",
-        "Русский": "Отвечай на русском языке.",
-        "العربية": "الرجاء الرد باللغة العربية."
-    }.get(language, "Respond in English.")
+    lang_instruction = ANALYSIS_LANGUAGE_INSTRUCTIONS.get(language, "Respond in English.")
     
     prompt = f"""{lang_instruction}
 
@@ -1311,14 +2131,14 @@ Please provide:
 Keep the analysis factual, balanced, and around 300-400 words total."""
 
     try:
-        response = requests.post(
-            "https://api.groq.com/openai/v1/chat/completions",
+        response = get_http_session().post(
+            GROQ_API_URL,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             },
             json={
-                "model": "llama-3.3-70b-versatile",
+                "model": GROQ_MODEL,
                 "messages": [
                     {"role": "system", "content": "You are a professional economic analyst."},
                     {"role": "user", "content": prompt}
@@ -1345,8 +2165,8 @@ with st.sidebar:
     st.subheader(t("language"))
     language = st.selectbox(
         "Language",
-        options=list(TRANSLATIONS.keys()),
-        index=list(TRANSLATIONS.keys()).index(st.session_state.language),
+        options=LANGUAGES,
+        index=LANGUAGE_INDEX[st.session_state.language],
         label_visibility="collapsed"
     )
     
@@ -1361,30 +2181,33 @@ with st.sidebar:
     
     asset1_name = st.selectbox(
         t("first_asset"),
-        options=list(NAME_TO_TICKER.keys()),
-        index=list(NAME_TO_TICKER.keys()).index("Bitcoin")
+        options=ASSET_NAMES,
+        index=ASSET_NAME_INDEX["Bitcoin"]
     )
     asset1_ticker = NAME_TO_TICKER[asset1_name]
     
     asset2_name = st.selectbox(
         t("second_asset"),
-        options=list(NAME_TO_TICKER.keys()),
-        index=list(NAME_TO_TICKER.keys()).index("S&P 500")
+        options=ASSET_NAMES,
+        index=ASSET_NAME_INDEX["S&P 500"]
     )
     asset2_ticker = NAME_TO_TICKER[asset2_name]
     
     st.subheader(t("period"))
-    years = st.slider(t("num_years"), min_value=1, max_value=10, value=5)
+    years = st.slider(t("num_years"), min_value=1, max_value=MAX_YEARS, value=5)
     
     st.subheader(t("display_options"))
     show_normalized = st.checkbox(t("show_normalized"), value=True)
     show_drawdown = st.checkbox(t("show_drawdown"), value=True)
     show_volume = st.checkbox(t("show_volume"), value=False)
+    show_correlation = st.checkbox(t("show_correlation"), value=True)
+    show_news = st.checkbox(t("show_news"), value=False)
+    show_raw_data = st.checkbox(t("show_raw_data"), value=False)
     
     st.markdown("---")
     
     if st.button(t("refresh_data"), use_container_width=True):
-        st.cache_data.clear()
+        refresh_all_data()
         st.rerun()
     
     st.markdown("---")
@@ -1410,9 +2233,16 @@ tab_comparison, tab_economic, tab_credit = st.tabs([
 with tab_comparison:
     st.markdown(f"**{t('comparison')}:** {asset1_name} {t('vs')} {asset2_name} {t('over')} {years} {t('years')}")
     
+    # Everything below is derived from the prices of this one snapshot window
+    snapshot = price_snapshot()
+    
     with st.spinner(t("loading_data")):
-        df1 = load_asset_data(asset1_ticker, years)
-        df2 = load_asset_data(asset2_ticker, years)
+        # Price history and headlines are independent requests, so fetch them concurrently
+        loaders = [lambda: load_assets_data([asset1_ticker, asset2_ticker], years, snapshot)]
+        if show_news:
+            loaders += [lambda: get_news(asset1_ticker), lambda: get_news(asset2_ticker)]
+        assets, *news = run_in_threads(lambda load: load(), loaders)
+        df1, df2 = assets[asset1_ticker], assets[asset2_ticker]
     
     if df1.empty or df2.empty:
         st.error(t("error_loading"))
@@ -1421,80 +2251,45 @@ with tab_comparison:
     # Key Metrics
     st.header(t("key_metrics"))
     
+    metrics1 = compute_asset_metrics(asset1_ticker, years, snapshot)
+    metrics2 = compute_asset_metrics(asset2_ticker, years, snapshot)
+    return1, return2 = metrics1['return'], metrics2['return']
+    
     col1, col2, col3, col4 = st.columns(4)
     
-    return1 = calculate_returns(df1['Close'])
     with col1:
         st.metric(label=f"{t('return')} {asset1_name}", value=f"{return1:.1f}%",
                   delta=f"{return1:.1f}%" if return1 != 0 else None)
     
-    return2 = calculate_returns(df2['Close'])
     with col2:
         st.metric(label=f"{t('return')} {asset2_name}", value=f"{return2:.1f}%",
                   delta=f"{return2:.1f}%" if return2 != 0 else None)
     
-    vol1 = calculate_volatility(df1['Close'])
     with col3:
-        st.metric(label=f"{t('volatility')} {asset1_name}", value=f"{vol1:.1f}%")
+        st.metric(label=f"{t('volatility')} {asset1_name}", value=f"{metrics1['volatility']:.1f}%")
     
-    vol2 = calculate_volatility(df2['Close'])
     with col4:
-        st.metric(label=f"{t('volatility')} {asset2_name}", value=f"{vol2:.1f}%")
+        st.metric(label=f"{t('volatility')} {asset2_name}", value=f"{metrics2['volatility']:.1f}%")
     
     col5, col6, col7, col8 = st.columns(4)
     
     with col5:
-        st.metric(label=f"{t('current_price')} {asset1_name}", value=f"${df1['Close'].iloc[-1]:,.2f}")
+        st.metric(label=f"{t('current_price')} {asset1_name}", value=f"${metrics1['last_price']:,.2f}")
     
     with col6:
-        st.metric(label=f"{t('current_price')} {asset2_name}", value=f"${df2['Close'].iloc[-1]:,.2f}")
+        st.metric(label=f"{t('current_price')} {asset2_name}", value=f"${metrics2['last_price']:,.2f}")
     
     with col7:
-        st.metric(label=f"{t('sharpe')} {asset1_name}", value=f"{calculate_sharpe_ratio(df1['Close']):.2f}")
+        st.metric(label=f"{t('sharpe')} {asset1_name}", value=f"{metrics1['sharpe']:.2f}")
     
     with col8:
-        st.metric(label=f"{t('sharpe')} {asset2_name}", value=f"{calculate_sharpe_ratio(df2['Close']):.2f}")
+        st.metric(label=f"{t('sharpe')} {asset2_name}", value=f"{metrics2['sharpe']:.2f}")
     
     # Main Chart
     st.markdown("---")
     st.header(t("performance_comparison"))
     
-    df1_plot = df1[['Date', 'Close']].copy()
-    df2_plot = df2[['Date', 'Close']].copy()
-    
-    if show_normalized:
-        df1_plot['Close'] = normalize_series(df1['Close'])
-        df2_plot['Close'] = normalize_series(df2['Close'])
-        y_label = t("normalized_price_zscore")
-    else:
-        y_label = t("price_usd")
-    
-    df1_plot = df1_plot.rename(columns={'Close': asset1_name})
-    df2_plot = df2_plot.rename(columns={'Close': asset2_name})
-    
-    merged = pd.merge(df1_plot, df2_plot, on='Date', how='inner')
-    merged_melted = merged.melt(id_vars=['Date'], var_name=t('asset'), value_name=t('prices'))
-    
-    chart_title = f"{t('normalized_prices') if show_normalized else t('prices')}: {asset1_name} {t('vs')} {asset2_name}"
-    fig_main = px.line(merged_melted, x='Date', y=t('prices'), color=t('asset'), title=chart_title,
-                       color_discrete_map={asset1_name: '#C45B28', asset2_name: '#1B6B4A'},
-                       template='plotly_white')
-    
-    fig_main.update_layout(
-        xaxis_title=t("date"), yaxis_title=y_label,
-        hovermode="x unified", height=450,
-        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
-        font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12),
-        title=dict(font=dict(color='#2D2418', size=16)),
-        legend=dict(
-            orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5,
-            font=dict(color='#2D2418', size=12),
-            bgcolor='rgba(255,254,250,0.9)'
-        ),
-        xaxis=dict(tickfont=dict(color='#3D3428')),
-        yaxis=dict(tickfont=dict(color='#3D3428'))
-    )
-    fig_main.update_traces(line=dict(width=2.5))
+    fig_main = build_main_figure(asset1_ticker, asset2_ticker, years, snapshot, show_normalized, st.session_state.language)
     st.plotly_chart(fig_main, use_container_width=True)
     
     # Drawdown Chart
@@ -1502,145 +2297,129 @@ with tab_comparison:
         st.markdown("---")
         st.header(t("drawdowns_title"))
         
-        df1['Drawdown'] = calculate_drawdown(df1['Close'])
-        df2['Drawdown'] = calculate_drawdown(df2['Close'])
-        
-        fig_dd = go.Figure()
-        fig_dd.add_trace(go.Scatter(x=df1['Date'], y=df1['Drawdown'], fill='tozeroy', name=asset1_name,
-                                     line=dict(color='#C45B28', width=2), fillcolor='rgba(196, 91, 40, 0.25)'))
-        fig_dd.add_trace(go.Scatter(x=df2['Date'], y=df2['Drawdown'], fill='tozeroy', name=asset2_name,
-                                     line=dict(color='#1B6B4A', width=2), fillcolor='rgba(27, 107, 74, 0.25)'))
-        
-        fig_dd.update_layout(
-            title=dict(text=t("drawdowns_from_ath"), font=dict(color='#2D2418', size=16)),
-            xaxis_title=t("date"), yaxis_title="Drawdown (%)",
-            template='plotly_white', height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
-            font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12),
-            legend=dict(
-                orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5,
-                font=dict(color='#2D2418', size=12),
-                bgcolor='rgba(255,254,250,0.9)'
-            ),
-            xaxis=dict(tickfont=dict(color='#3D3428')),
-            yaxis=dict(tickfont=dict(color='#3D3428'))
-        )
+        fig_dd = build_drawdown_figure(asset1_ticker, asset2_ticker, years, snapshot, st.session_state.language)
         st.plotly_chart(fig_dd, use_container_width=True)
         
         col_dd1, col_dd2 = st.columns(2)
         with col_dd1:
-            st.metric(f"{t('max_drawdown')} {asset1_name}", f"{df1['Drawdown'].min():.1f}%")
+            st.metric(f"{t('max_drawdown')} {asset1_name}", f"{metrics1['max_drawdown']:.1f}%")
         with col_dd2:
-            st.metric(f"{t('max_drawdown')} {asset2_name}", f"{df2['Drawdown'].min():.1f}%")
+            st.metric(f"{t('max_drawdown')} {asset2_name}", f"{metrics2['max_drawdown']:.1f}%")
     
     # Volume Chart
     if show_volume:
         st.markdown("---")
         st.header(t("trading_volumes"))
         
-        fig_vol = make_subplots(rows=2, cols=1, shared_xaxes=True,
-                                subplot_titles=(f"{t('volume')} {asset1_name}", f"{t('volume')} {asset2_name}"))
-        fig_vol.add_trace(go.Bar(x=df1['Date'], y=df1['Volume'], name=asset1_name, marker=dict(color='#C45B28')), row=1, col=1)
-        fig_vol.add_trace(go.Bar(x=df2['Date'], y=df2['Volume'], name=asset2_name, marker=dict(color='#1B6B4A')), row=2, col=1)
-        
-        fig_vol.update_layout(height=450, template='plotly_white', showlegend=False,
-                              paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
-                              font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12))
-        fig_vol.update_xaxes(tickfont=dict(color='#3D3428'))
-        fig_vol.update_yaxes(tickfont=dict(color='#3D3428'))
-        fig_vol.update_annotations(font=dict(color='#2D2418', size=14))
+        fig_vol = build_volume_figure(asset1_ticker, asset2_ticker, years, snapshot, st.session_state.language)
         st.plotly_chart(fig_vol, use_container_width=True)
     
     # Correlation
-    st.markdown("---")
-    st.header(t("correlation_analysis"))
-    
-    merged_corr = pd.merge(df1[['Date', 'Close']].rename(columns={'Close': 'Asset1'}),
-                           df2[['Date', 'Close']].rename(columns={'Close': 'Asset2'}), on='Date', how='inner')
-    merged_corr['Return1'] = merged_corr['Asset1'].pct_change()
-    merged_corr['Return2'] = merged_corr['Asset2'].pct_change()
-    merged_corr['Rolling_Corr'] = merged_corr['Return1'].rolling(window=30).corr(merged_corr['Return2'])
-    
-    col_corr1, col_corr2 = st.columns([1, 2])
-    
-    with col_corr1:
-        overall_corr = merged_corr['Return1'].corr(merged_corr['Return2'])
-        st.metric(t("overall_correlation"), f"{overall_corr:.3f}")
-        st.markdown(f"""**{t('interpretation')}:**
+    if show_correlation:
+        st.markdown("---")
+        st.header(t("correlation_analysis"))
+        
+        col_corr1, col_corr2 = st.columns([1, 2])
+        
+        with col_corr1:
+            overall_corr = calculate_overall_correlation(asset1_ticker, asset2_ticker, years, snapshot)
+            st.metric(t("overall_correlation"), f"{overall_corr:.3f}")
+            if not np.isnan(overall_corr):
+                st.caption(t(classify_correlation(overall_corr)))
+            st.markdown(f"""**{t('interpretation')}:**
         - **> 0.7**: {t('strong_positive')}
         - **0.3 - 0.7**: {t('moderate')}
         - **-0.3 - 0.3**: {t('weak')}
         - **< -0.3**: {t('negative')}""")
-    
-    with col_corr2:
-        fig_corr = px.line(merged_corr, x='Date', y='Rolling_Corr', title=f"{t('rolling_correlation')} (30 {t('days')})")
-        fig_corr.add_hline(y=0, line_dash="dash", line_color="#8B7355")
-        fig_corr.update_traces(line=dict(color='#C45B28', width=2.5))
-        fig_corr.update_layout(
-            yaxis_title=t("overall_correlation"), height=300,
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='#FFFEFA',
-            font=dict(family="Source Sans Pro, sans-serif", color='#2D2418', size=12),
-            title=dict(font=dict(color='#2D2418', size=14)),
-            xaxis=dict(tickfont=dict(color='#3D3428')),
-            yaxis=dict(tickfont=dict(color='#3D3428'))
-        )
-        st.plotly_chart(fig_corr, use_container_width=True)
+        
+        with col_corr2:
+            fig_corr = build_correlation_figure(asset1_ticker, asset2_ticker, years, snapshot, st.session_state.language)
+            st.plotly_chart(fig_corr, use_container_width=True)
     
     # News
-    st.markdown("---")
-    st.header(t("recent_news"))
-    
-    col_news1, col_news2 = st.columns(2)
-    
-    with col_news1:
-        st.subheader(f"📰 {asset1_name}")
-        news1 = get_news(asset1_ticker)
-        if news1:
-            for entry in news1:
-                st.markdown(f"**[{entry.title}]({entry.link})**")
-                if hasattr(entry, 'published'):
-                    st.caption(entry.published)
-                st.markdown("---")
-        else:
-            st.info(t("no_news"))
-    
-    with col_news2:
-        st.subheader(f"📰 {asset2_name}")
-        news2 = get_news(asset2_ticker)
-        if news2:
-            for entry in news2:
-                st.markdown(f"**[{entry.title}]({entry.link})**")
-                if hasattr(entry, 'published'):
-                    st.caption(entry.published)
-                st.markdown("---")
-        else:
-            st.info(t("no_news"))
-    
-    # Raw Data & Export
-    st.markdown("---")
-    st.header(t("raw_data"))
-    
-    with st.expander(f"{t('view_data')} {asset1_name}"):
-        st.dataframe(df1, use_container_width=True)
+    if show_news:
+        st.markdown("---")
+        st.header(t("recent_news"))
+        
+        news1, news2 = news
+        
+        col_news1, col_news2 = st.columns(2)
+        
+        with col_news1:
+            st.subheader(f"📰 {asset1_name}")
+            if news1:
+                for entry in news1:
+                    st.markdown(f"**[{entry['title']}]({entry['link']})**")
+                    if entry['published']:
+                        st.caption(entry['published'])
+                    st.markdown("---")
+            else:
+                st.info(t("no_news"))
+        
+        with col_news2:
+            st.subheader(f"📰 {asset2_name}")
+            if news2:
+                for entry in news2:
+                    st.markdown(f"**[{entry['title']}]({entry['link']})**")
+                    if entry['published']:
+                        st.caption(entry['published'])
+                    st.markdown("---")
+            else:
+                st.info(t("no_news"))
     
-    with st.expander(f"{t('view_data')} {asset2_name}"):
-        st.dataframe(df2, use_container_width=True)
+    # Raw Data
+    if show_raw_data:
+        st.markdown("---")
+        st.header(t("raw_data"))
+        
+        # By default only the recent rows of the charted columns are sent to the browser;
+        # the full OHLC frame is read from disk only on request
+        if st.checkbox(t("show_all_raw_data"), value=False):
+            raw1, raw2 = load_full_asset_data(asset1_ticker, years), load_full_asset_data(asset2_ticker, years)
+        else:
+            raw1, raw2 = df1.tail(RAW_DATA_ROWS), df2.tail(RAW_DATA_ROWS)
+        
+        # Formatted by the browser, so no per-cell formatting happens in Python
+        raw_column_config = {'Date': st.column_config.DateColumn(format="YYYY-MM-DD")}
+        raw_column_config.update({column: st.column_config.NumberColumn(format="%.2f")
+                                  for column in ('Open', 'High', 'Low', 'Close')})
+        
+        with st.expander(f"{t('view_data')} {asset1_name}"):
+            st.dataframe(raw1, use_container_width=True, column_config=raw_column_config)
+        
+        with st.expander(f"{t('view_data')} {asset2_name}"):
+            st.dataframe(raw2, use_container_width=True, column_config=raw_column_config)
     
+    # Export
     st.markdown("---")
     st.header(t("export_data"))
     
     col_export1, col_export2 = st.columns(2)
     with col_export1:
-        st.download_button(label=f"{t('download')} {asset1_name} (CSV)", data=df1.to_csv(index=False),
+        st.download_button(label=f"{t('download')} {asset1_name} (CSV)",
+                           data=export_asset_data(asset1_ticker, years, snapshot, "csv"),
                            file_name=f"{asset1_ticker}_{years}y.csv", mime="text/csv")
+        st.download_button(label=f"{t('download')} {asset1_name} (Parquet)",
+                           data=export_asset_data(asset1_ticker, years, snapshot, "parquet"),
+                           file_name=f"{asset1_ticker}_{years}y.parquet", mime="application/octet-stream")
     with col_export2:
-        st.download_button(label=f"{t('download')} {asset2_name} (CSV)", data=df2.to_csv(index=False),
+        st.download_button(label=f"{t('download')} {asset2_name} (CSV)",
+                           data=export_asset_data(asset2_ticker, years, snapshot, "csv"),
                            file_name=f"{asset2_ticker}_{years}y.csv", mime="text/csv")
+        st.download_button(label=f"{t('download')} {asset2_name} (Parquet)",
+                           data=export_asset_data(asset2_ticker, years, snapshot, "parquet"),
+                           file_name=f"{asset2_ticker}_{years}y.parquet", mime="application/octet-stream")
 
 
 # =============================================================================
 # TAB 2: ECONOMIC ANALYSIS
 # =============================================================================
-with tab_economic:
+# The economic and credit tabs only depend on their own widgets, so they run as fragments:
+# typing a ticker or picking a continent reruns that tab alone instead of reloading and
+# redrawing the comparison charts.
+@st.fragment
+def render_economic_tab():
+    """Render the economic analysis tab."""
     st.markdown(f"*{t('analysis_disclaimer')}*")
     
     api_key_from_secrets = st.secrets.get("GROQ_API_KEY", None) if hasattr(st, 'secrets') else None
@@ -1693,10 +2472,16 @@ with tab_economic:
         st.info("👆 " + t("api_key_required") + " " + t("api_key_help") + " [console.groq.com](https://console.groq.com)")
 
 
+with tab_economic:
+    render_economic_tab()
+
+
 # =============================================================================
 # TAB 3: CREDIT RISK ANALYSIS
 # =============================================================================
-with tab_credit:
+@st.fragment
+def render_credit_tab():
+    """Render the credit risk analysis tab."""
     st.markdown(f"### {t('credit_risk_title')}")
     st.markdown(f"*{t('merton_explanation')}*")
     
@@ -1785,34 +2570,42 @@ with tab_credit:
                 st.markdown("---")
                 st.subheader(t("benchmark_companies"))
                 
-                benchmark_tickers = ['AAPL', 'MSFT', 'BA', 'F', 'AAL']
+                benchmark_tickers = [bticker for bticker in ['AAPL', 'MSFT', 'BA', 'F', 'AAL']
+                                     if bticker.upper() != ticker_input.upper()]
                 benchmark_data = []
                 
-                for bticker in benchmark_tickers:
-                    if bticker.upper() != ticker_input.upper():
-                        bdata = get_credit_risk_data(bticker)
-                        if bdata.get('success', False):
-                            bV = bdata['market_cap'] + bdata['total_debt']
-                            bDD = calculate_distance_to_default(bV, bdata['total_debt'], bdata['equity_volatility'], risk_free_rate, time_horizon)
-                            bPD = calculate_probability_of_default(bDD)
-                            benchmark_data.append({
-                                'Ticker': bticker,
-                                'Company': bdata['company_name'][:20],
-                                'DD (σ)': f"{bDD:.2f}",
-                                'PD (%)': f"{bPD*100:.2f}%"
-                            })
+                # Benchmarks that need Yahoo get their prices in one batched download, and each
+                # one's remaining requests are independent, so they are fetched concurrently
+                prefetched = prefetch_credit_prices(benchmark_tickers)
+                benchmark_results = run_in_threads(lambda bticker: get_credit_risk_data(bticker, prefetched.get(bticker)),
+                                                   benchmark_tickers)
+                for bticker, bdata in zip(benchmark_tickers, benchmark_results):
+                    if bdata.get('success', False):
+                        bV = bdata['market_cap'] + bdata['total_debt']
+                        bDD = calculate_distance_to_default(bV, bdata['total_debt'], bdata['equity_volatility'], risk_free_rate, time_horizon)
+                        bPD = calculate_probability_of_default(bDD)
+                        benchmark_data.append({
+                            'Ticker': bticker,
+                            'Company': bdata['company_name'][:20],
+                            'DD (σ)': bDD,
+                            'PD (%)': bPD * 100
+                        })
                 
                 if benchmark_data:
                     # Add the analyzed company
                     benchmark_data.insert(0, {
                         'Ticker': ticker_input.upper(),
                         'Company': company_name[:20] + " ⭐",
-                        'DD (σ)': f"{DD:.2f}",
-                        'PD (%)': f"{PD*100:.2f}%"
+                        'DD (σ)': DD,
+                        'PD (%)': PD * 100
                     })
                     
                     bench_df = pd.DataFrame(benchmark_data)
-                    st.dataframe(bench_df, use_container_width=True, hide_index=True)
+                    # Numeric columns formatted by the browser, which also keeps them sortable
+                    st.dataframe(bench_df, use_container_width=True, hide_index=True, column_config={
+                        'DD (σ)': st.column_config.NumberColumn(format="%.2f"),
+                        'PD (%)': st.column_config.NumberColumn(format="%.2f%%")
+                    })
                 
             else:
                 st.error(t("data_unavailable"))
@@ -1841,3 +2634,7 @@ with tab_credit:
         
         **Limitation:** Live predictions would require mapping current financial statement data from Yahoo Finance to the exact ratios used in training (X1-X18 from Compustat). This mapping is non-trivial and would require access to the original feature definitions.
         """)
+
+
+with tab_credit:
+    render_credit_tab()